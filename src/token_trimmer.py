@@ -1,9 +1,198 @@
 import os
 import re
+import mmap
 import argparse
+import functools
 import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns shared by the optimizers, compiled once at import time
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+_MD_BLANK_RUN_RE = re.compile(r'\n{4,}')
+
+# Single-pass tokenizers for source code: multi-line string literals and
+# comments are emitted verbatim, everything else is a code span that gets
+# normalized. Literal and comment bodies are unrolled loops
+# (normal* (special normal*)*) so they are consumed by character classes in
+# one forward pass, without a lazy quantifier or alternation being retried
+# at every character.
+_TRIPLE_STR = (
+    r'"""[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'
+    r"|'''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"
+)
+_STRING_LIT = r'"[^"\\]*(?:\\.[^"\\]*)*"' r"|'[^'\\]*(?:\\.[^'\\]*)*'"
+_BLOCK_COMMENT = r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/'
+
+# A literal without a raw newline can't hold trailing whitespace or blank
+# lines, so it is safe to normalize along with the code around it. Matching
+# every pattern in one alternation lets a whole run of code, one-line
+# strings and one-line comments come back as a single span, instead of a
+# Python-level token for each string or comment.
+_LINE_STRING_LIT = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"' r"|'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+_LINE_BLOCK_COMMENT = r'/\*[^*\n]*\*+(?:[^/*\n][^*\n]*\*+)*/'
+_PY_TOKEN_RE = re.compile(
+    r'(?P<code>(?:'
+    r'[^"\'#]+|#[^\n]*'
+    r'|(?!"""|\'\'\')(?:' + _LINE_STRING_LIT + r')'
+    # A quote that opens no complete string is plain code
+    r'|(?!' + _STRING_LIT + r')["\']'
+    r')+)'
+    r'|(?P<keep>' + _TRIPLE_STR + r'|' + _STRING_LIT + r')',
+    re.DOTALL
+)
+_C_TOKEN_RE = re.compile(
+    r'(?P<code>(?:'
+    r'[^"\'/]+|//[^\n]*|' + _LINE_BLOCK_COMMENT +
+    r'|' + _LINE_STRING_LIT +
+    # Quotes and slashes that open no complete literal are plain code
+    r'|(?!' + _STRING_LIT + r')["\']'
+    r'|(?!' + _BLOCK_COMMENT + r')/'
+    r')+)'
+    r'|(?P<keep>' + _STRING_LIT + r'|' + _BLOCK_COMMENT + r')',
+    re.DOTALL
+)
+
+# HTML/CSS cleanup passes. Each one depends on the text left by the one
+# before it (a stripped comment can leave a space run or a gap between
+# tags behind), so they stay sequential; the comment bodies are unrolled
+# loops like the tokenizers above.
+_HTML_COMMENT_RE = re.compile(r'<!--[^-]*(?:-(?!->)[^-]*)*-->')
+_CSS_COMMENT_RE = re.compile(_BLOCK_COMMENT)
+_SPACE_RUN_RE = re.compile(r' {2,}')
+_TAG_GAP_RE = re.compile(r'>\s+<')
+
+# orjson turns integers wider than 64 bits into floats, so JSON with long
+# digit runs goes through the stdlib parser
+_LONG_DIGITS_RE = re.compile(r'\d{19}')
+
+# Captured so re.split keeps the code blocks between the prose chunks
+_MD_FENCE_RE = re.compile(r'(```.*?```)', re.DOTALL)
+
+
+# Whitespace str.rstrip() strips besides spaces and tabs. It is rare enough
+# to look for anywhere in the text, not just at line ends.
+_RARE_WS_CHARS = ('\f', '\v', '\x1c', '\x1d', '\x1e', '\x1f')
+_NON_ASCII_WS_RE = re.compile(
+    '[\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+)
+
+try:
+    _is_ascii = str.isascii
+except AttributeError:
+    # Python < 3.7
+    def _is_ascii(text):
+        return len(text.encode('utf-8', 'surrogatepass')) == len(text)
+
+
+def _has_trailing_whitespace(text, at_end):
+    """
+    Check whether str.rstrip() could change any line of text.
+    
+    A few substring searches run far faster than splitting text into lines,
+    so clean files skip the split/strip/join round-trip altogether. Rare
+    whitespace anywhere counts as a hit; a false positive only costs the
+    split. The last line only counts when at_end says it ends the file.
+    """
+    last = text[-1:]
+    if at_end and last != '\n' and last.isspace():
+        return True
+    if ' \n' in text or '\t\n' in text:
+        return True
+    if any(ws in text for ws in _RARE_WS_CHARS):
+        return True
+    return not _is_ascii(text) and _NON_ASCII_WS_RE.search(text) is not None
+
+
+# Files at least this large are memory-mapped instead of read into the
+# per-thread scratch buffer
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Files larger than this (typically generated fixtures) or with a NUL byte
+# near the start (binary data) are copied as-is without being decoded
+_MAX_TEXT_SIZE = 5 * 1024 * 1024
+_BINARY_SNIFF_SIZE = 4096
+
+_scratch = threading.local()
+
+
+def _read_text(file_path):
+    """
+    Read a file as UTF-8 text, or return None if it is too large or looks binary.
+    
+    Small files are read into a scratch buffer that each thread reuses
+    across files, so a directory run doesn't allocate a fresh bytes object
+    per file. Large files are decoded straight from a read-only memory map,
+    letting the OS page them in on demand. Both checks run on the raw bytes,
+    before any decoding is paid for.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        # Empty files cannot be mapped
+        if size == 0:
+            return ''
+        if size > _MAX_TEXT_SIZE:
+            return None
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'\x00', 0, _BINARY_SNIFF_SIZE) != -1:
+                    return None
+                content = str(mm, 'utf-8', 'replace')
+        else:
+            buffer = getattr(_scratch, 'buffer', None)
+            if buffer is None or len(buffer) < size:
+                # Only ever grows, so it settles at the largest small file seen
+                buffer = _scratch.buffer = bytearray(size)
+            with memoryview(buffer) as view:
+                length = f.readinto(view[:size])
+                if buffer.find(b'\x00', 0, min(length, _BINARY_SNIFF_SIZE)) != -1:
+                    return None
+                content = str(view[:length], 'utf-8', 'replace')
+    
+    # Translate newlines the way text-mode reads used to
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _write_bytes(file_path, data):
+    """Write data through a raw file descriptor, skipping Python's buffered text layers."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o644)
+    try:
+        with memoryview(data) as view:
+            written = 0
+            # os.write may write less than asked for
+            while written < len(view):
+                written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src_path, dst_path):
+    """
+    Copy a file as-is, keeping its permission bits.
+    
+    copyfile uses the kernel fast path (sendfile on Linux); copymode then
+    carries over the mode (e.g. the executable bit) without the timestamp
+    and flag calls copy2 makes through copystat.
+    """
+    shutil.copyfile(src_path, dst_path)
+    shutil.copymode(src_path, dst_path)
+
+
+def _optimize_job(job):
+    """Run a single optimize_file call; top-level so worker processes can unpickle it."""
+    optimizer, src_path, dst_path = job
+    return optimizer.optimize_file(src_path, dst_path)
+
 
 class TokenTrimmer:
     """
@@ -32,12 +221,31 @@ class TokenTrimmer:
             'bytes_saved': 0
         }
         
+        # Optimizer for each extension, resolved once instead of per file;
+        # extensions not listed get the generic optimization
+        optimize_python = functools.partial(self._optimize_code, token_re=_PY_TOKEN_RE)
+        optimize_c_style = functools.partial(self._optimize_code, token_re=_C_TOKEN_RE)
+        self._dispatch = {
+            '.py': optimize_python,
+            '.cs': optimize_c_style,
+            '.java': optimize_c_style,
+            '.js': optimize_c_style,
+            '.ts': optimize_c_style,
+            '.cpp': optimize_c_style,
+            '.c': optimize_c_style,
+            '.h': optimize_c_style,
+            '.json': self._optimize_json,
+            '.html': self._optimize_markup,
+            '.css': self._optimize_markup,
+            '.md': self._optimize_markdown,
+        }
+        
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
 
     def is_processable_file(self, file_path):
         """Check if the file should be processed based on its extension."""
-        ext = file_path.suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
         return ext in self.file_extensions or (ext == '.md' and not self.preserve_md)
 
     def optimize_file(self, file_path, output_path):
@@ -46,218 +254,269 @@ class TokenTrimmer:
         
         Args:
             file_path: Path to the file to optimize
-            output_path: Path where the optimized file will be saved
+            output_path: Path where the optimized file will be saved; its
+                directory must already exist
             
         Returns:
-            Tuple of (blank lines removed, whitespace chars removed, bytes saved)
+            Tuple of (blank lines removed, whitespace chars removed, bytes saved),
+            or None if the file was binary or oversized and copied as-is
         """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                original_size = len(content)
-                
-            # Make sure output directory exists
-            os.makedirs(output_path.parent, exist_ok=True)
+            content = _read_text(file_path)
+            if content is None:
+                # Binary or oversized; not worth decoding
+                _copy_file(file_path, output_path)
+                return None
+            original_size = len(content)
             
             # Optimize content based on file type
-            ext = file_path.suffix.lower()
+            ext = os.path.splitext(file_path)[1].lower()
             
-            if ext in ['.py', '.cs', '.java', '.js', '.ts', '.cpp', '.c', '.h']:
-                optimized_content = self._optimize_code(content, ext)
-            elif ext in ['.json']:
-                optimized_content = self._optimize_json(content)
-            elif ext in ['.html', '.css']:
-                optimized_content = self._optimize_markup(content)
-            elif ext == '.md':
-                optimized_content = self._optimize_markdown(content)
-            else:
-                # For unknown types, just do basic whitespace reduction
-                optimized_content = self._optimize_generic(content)
+            # Each optimizer counts what it removes as it goes
+            optimize = self._dispatch.get(ext, self._optimize_generic)
+            optimized_content, blank_lines_removed, whitespace_chars_removed = optimize(content)
             
-            # Calculate metrics
-            blank_lines_removed = content.count('\n\n') - optimized_content.count('\n\n')
-            whitespace_chars_removed = content.count(' ') - optimized_content.count(' ')
-            whitespace_chars_removed += content.count('\t') - optimized_content.count('\t')
             bytes_saved = original_size - len(optimized_content)
             
             # Write optimized content
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(optimized_content)
+            _write_bytes(output_path, optimized_content.encode('utf-8'))
                 
             return blank_lines_removed, whitespace_chars_removed, bytes_saved
             
         except Exception as e:
             print(f"Error processing {file_path}: {e}")
             # Copy the file as-is
-            shutil.copy2(file_path, output_path)
+            _copy_file(file_path, output_path)
             return 0, 0, 0
 
-    def _optimize_code(self, content, ext):
-        """Optimize code files while preserving syntax and functionality."""
-        # Store code in strings/comments to protect them
-        protected_parts = {}
+    def _optimize_code(self, content, token_re):
+        """
+        Optimize code files while preserving syntax and functionality.
         
-        # Protect string literals
-        if ext in ['.py', '.cs', '.java', '.js', '.ts']:
-            # Protect triple-quoted strings in Python
-            if ext == '.py':
-                for i, match in enumerate(re.finditer(r'""".*?"""|\'\'\' .*?\'\'\'', content, re.DOTALL)):
-                    key = f"__PROTECTED_STRING_{i}__"
-                    protected_parts[key] = match.group(0)
-                    content = content.replace(match.group(0), key)
+        Args:
+            content: Source text to optimize
+            token_re: Tokenizer for the file's language family
             
-            # Protect regular string literals
-            for i, match in enumerate(re.finditer(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'', content)):
-                key = f"__PROTECTED_STRING_{i + 100}__"  # Offset to avoid conflicts
-                protected_parts[key] = match.group(0)
-                content = content.replace(match.group(0), key)
-        
-        # Protect comments
-        if ext == '.py':
-            # Protect Python comments
-            for i, match in enumerate(re.finditer(r'#.*?$', content, re.MULTILINE)):
-                key = f"__PROTECTED_COMMENT_{i}__"
-                protected_parts[key] = match.group(0)
-                content = content.replace(match.group(0), key)
-        elif ext in ['.cs', '.java', '.cpp', '.c', '.h', '.js', '.ts']:
-            # Protect C-style comments (both // and /* */)
-            for i, match in enumerate(re.finditer(r'//.*?$|/\*.*?\*/', content, re.MULTILINE | re.DOTALL)):
-                key = f"__PROTECTED_COMMENT_{i}__"
-                protected_parts[key] = match.group(0)
-                content = content.replace(match.group(0), key)
+        Returns:
+            Tuple of (optimized content, blank lines removed, whitespace chars removed)
+        """
+        end = len(content)
+        parts = []
+        blank_lines_removed = whitespace_chars_removed = 0
         
-        # Reduce multiple blank lines to at most one
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        # Multi-line literals are copied verbatim; only code spans are touched
+        for match in token_re.finditer(content):
+            if match.lastgroup == 'code':
+                span, blank_lines, whitespace_chars = self._normalize_code_span(match.group(0), match.end() == end)
+                parts.append(span)
+                blank_lines_removed += blank_lines
+                whitespace_chars_removed += whitespace_chars
+            else:
+                parts.append(match.group(0))
         
-        # Reduce excessive indentation without changing code structure
-        lines = content.splitlines()
+        return ''.join(parts), blank_lines_removed, whitespace_chars_removed
+
+    def _normalize_code_span(self, span, at_end):
+        """
+        Normalize whitespace in a span of code outside multi-line literals.
         
-        # Process line by line
-        for i in range(len(lines)):
-            # Remove trailing whitespace
-            lines[i] = lines[i].rstrip()
-            
-            # Normalize indentation (keep tabs or spaces, just make them consistent)
-            if lines[i].startswith(' '):
-                # Count leading spaces
-                leading_spaces = len(lines[i]) - len(lines[i].lstrip(' '))
-                # Normalize to consistent indentation
-                if leading_spaces > 0 and leading_spaces % 4 == 0:
-                    # For 4-space indentation, normalize to exact multiples
-                    indent_level = leading_spaces // 4
-                    lines[i] = ' ' * (indent_level * 4) + lines[i].lstrip(' ')
+        The last line of a span only ends a real line when the span closes the
+        file; otherwise it runs into the following literal.
         
-        # Rejoin the lines
-        content = '\n'.join(lines)
+        Returns:
+            Tuple of (normalized span, blank lines removed, whitespace chars removed)
+        """
+        # Remove trailing whitespace; mapping str.rstrip runs the loop in C
+        stripped = span
+        if _has_trailing_whitespace(span, at_end):
+            lines = span.split('\n')
+            last = len(lines) if at_end else len(lines) - 1
+            lines[:last] = map(str.rstrip, lines[:last])
+            stripped = '\n'.join(lines)
         
-        # Restore protected parts
-        for key, value in protected_parts.items():
-            content = content.replace(key, value)
+        # Reduce multiple blank lines to at most one; the substring check
+        # skips the regex engine entirely when there is no run to collapse
+        collapsed = _BLANK_RUN_RE.sub('\n\n', stripped) if '\n\n\n' in stripped else stripped
         
-        return content
+        # Only whitespace and newlines were dropped, so the length deltas are the counts
+        return collapsed, len(stripped) - len(collapsed), len(span) - len(stripped)
 
     def _optimize_json(self, content):
-        """Optimize JSON files by removing unnecessary whitespace."""
+        """
+        Optimize JSON files by removing unnecessary whitespace.
+        
+        The size difference is counted as whitespace removed, though
+        re-serializing can also reformat numbers. Uses orjson when it is
+        installed; its float formatting differs from the json module's
+        (1e-7 vs 1e-07, 1.5e300 vs 1.5e+300), so a file's output depends
+        on whether orjson is available and on which path the file takes.
+        """
+        if orjson is not None and not _LONG_DIGITS_RE.search(content):
+            try:
+                # orjson output is already compact
+                compacted = orjson.dumps(orjson.loads(content)).decode('utf-8')
+                return compacted, 0, len(content) - len(compacted)
+            except (orjson.JSONDecodeError, orjson.JSONEncodeError):
+                # orjson is stricter than json (e.g. NaN, deep nesting), so
+                # let json have a go
+                pass
         try:
             import json
-            # Parse and compact JSON
+            # Parse and compact JSON, keeping non-ASCII text as-is like orjson
             parsed = json.loads(content)
-            return json.dumps(parsed, separators=(',', ':'))
+            compacted = json.dumps(parsed, separators=(',', ':'), ensure_ascii=False)
+            return compacted, 0, len(content) - len(compacted)
         except:
             # If JSON parsing fails, do basic whitespace reduction
             return self._optimize_generic(content)
 
     def _optimize_markup(self, content):
         """Optimize HTML/CSS files while preserving structure."""
-        # Remove comments
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+        # Remove comments; the substring checks skip passes with nothing to do
+        if '<!--' in content:
+            content = _HTML_COMMENT_RE.sub('', content)
+        if '/*' in content:
+            content = _CSS_COMMENT_RE.sub('', content)
+        length = len(content)
         
         # Collapse multiple spaces to single space
-        content = re.sub(r' {2,}', ' ', content)
+        if '  ' in content:
+            content = _SPACE_RUN_RE.sub(' ', content)
         
         # Remove spaces around tags
-        content = re.sub(r'>\s+<', '><', content)
+        if '>' in content:
+            content = _TAG_GAP_RE.sub('><', content)
+        whitespace_chars_removed = length - len(content)
+        length = len(content)
         
         # Reduce multiple blank lines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        if '\n\n\n' in content:
+            content = _BLANK_RUN_RE.sub('\n\n', content)
+        blank_lines_removed = length - len(content)
         
-        return content
+        return content, blank_lines_removed, whitespace_chars_removed
 
     def _optimize_markdown(self, content):
         """
         Optimize markdown while preserving rendering.
         More careful with whitespace as it affects rendering.
         """
-        # Protect code blocks
-        protected_parts = {}
-        for i, match in enumerate(re.finditer(r'```.*?```', content, re.DOTALL)):
-            key = f"__PROTECTED_CODE_{i}__"
-            protected_parts[key] = match.group(0)
-            content = content.replace(match.group(0), key)
+        # Split the code blocks out in one sweep so they are kept verbatim;
+        # even indices are prose, odd ones are code blocks
+        parts = _MD_FENCE_RE.split(content)
+        blank_lines_removed = whitespace_chars_removed = 0
+        for i in range(0, len(parts), 2):
+            parts[i], blank_lines, whitespace_chars = self._normalize_markdown_text(parts[i], i == len(parts) - 1)
+            blank_lines_removed += blank_lines
+            whitespace_chars_removed += whitespace_chars
         
-        # Reduce multiple blank lines to at most two (markdown often needs two for paragraph breaks)
-        content = re.sub(r'\n{4,}', '\n\n\n', content)
+        return ''.join(parts), blank_lines_removed, whitespace_chars_removed
+
+    def _normalize_markdown_text(self, text, at_end):
+        """
+        Normalize whitespace in markdown prose between code blocks.
         
-        # Remove trailing whitespace from lines
-        lines = content.splitlines()
-        for i in range(len(lines)):
-            # Keep trailing spaces for line breaks in markdown
-            if not lines[i].endswith('  '):
-                lines[i] = lines[i].rstrip()
+        The last line only ends a real line when the text closes the file;
+        otherwise it runs into the following code block.
         
-        content = '\n'.join(lines)
+        Returns:
+            Tuple of (normalized text, blank lines removed, whitespace chars removed)
+        """
+        # Reduce multiple blank lines to at most two (markdown often needs two for paragraph breaks)
+        length = len(text)
+        if '\n\n\n\n' in text:
+            text = _MD_BLANK_RUN_RE.sub('\n\n\n', text)
+        blank_lines_removed = length - len(text)
         
-        # Restore protected parts
-        for key, value in protected_parts.items():
-            content = content.replace(key, value)
+        # Remove trailing whitespace from lines
+        whitespace_chars_removed = 0
+        if _has_trailing_whitespace(text, at_end):
+            lines = text.split('\n')
+            last = len(lines) if at_end else len(lines) - 1
+            for i in range(last):
+                # Keep trailing spaces for line breaks in markdown
+                if not lines[i].endswith('  '):
+                    stripped = lines[i].rstrip()
+                    whitespace_chars_removed += len(lines[i]) - len(stripped)
+                    lines[i] = stripped
+            text = '\n'.join(lines)
         
-        return content
+        return text, blank_lines_removed, whitespace_chars_removed
 
     def _optimize_generic(self, content):
         """Generic optimization for unknown file types."""
+        # Remove trailing whitespace first, so whitespace-only lines count as blank
+        length = len(content)
+        if _has_trailing_whitespace(content, True):
+            content = '\n'.join(map(str.rstrip, content.split('\n')))
+        whitespace_chars_removed = length - len(content)
+        
         # Reduce multiple blank lines to at most one
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        length = len(content)
+        if '\n\n\n' in content:
+            content = _BLANK_RUN_RE.sub('\n\n', content)
+        blank_lines_removed = length - len(content)
         
-        # Remove trailing whitespace
-        lines = content.splitlines()
-        for i in range(len(lines)):
-            lines[i] = lines[i].rstrip()
-            
-        content = '\n'.join(lines)
-        return content
+        return content, blank_lines_removed, whitespace_chars_removed
+
+    def _walk(self, src_dir, rel_dir=''):
+        """
+        Yield (source path, relative path) for every file below src_dir,
+        creating each subdirectory in the output directory along the way.
+        """
+        try:
+            with os.scandir(src_dir) as it:
+                entries = list(it)
+        except OSError:
+            # Like os.walk, skip directories that can't be listed
+            return
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name)
+            # DirEntry caches the file type, so this costs no extra stat
+            if entry.is_dir():
+                os.makedirs(os.path.join(self.output_dir, rel_path), exist_ok=True)
+                # Like os.walk, don't descend into symlinked directories
+                if not entry.is_symlink():
+                    yield from self._walk(entry.path, rel_path)
+            else:
+                yield entry.path, rel_path
 
     def process_directory(self):
         """Process all relevant files in the input directory."""
-        # Copy directory structure first
-        for root, dirs, files in os.walk(self.input_dir):
-            for dir_name in dirs:
-                src_path = Path(root) / dir_name
-                rel_path = src_path.relative_to(self.input_dir)
-                dst_path = self.output_dir / rel_path
-                os.makedirs(dst_path, exist_ok=True)
+        # Mirror the directory structure, copy non-processable files and
+        # collect the rest for optimization in a single walk
+        jobs = []
+        for src_path, rel_path in self._walk(self.input_dir):
+            dst_path = os.path.join(self.output_dir, rel_path)
+            
+            if self.is_processable_file(src_path):
+                jobs.append((src_path, dst_path, rel_path))
+            else:
+                # Copy non-processable files as-is
+                _copy_file(src_path, dst_path)
+                print(f"Copied: {rel_path}")
         
-        # Process files
-        for root, dirs, files in os.walk(self.input_dir):
-            for file_name in files:
-                src_path = Path(root) / file_name
-                rel_path = src_path.relative_to(self.input_dir)
-                dst_path = self.output_dir / rel_path
-                
-                if self.is_processable_file(src_path):
-                    blank_removed, whitespace_removed, bytes_saved = self.optimize_file(src_path, dst_path)
-                    
-                    self.stats['files_processed'] += 1
-                    self.stats['blank_lines_removed'] += blank_removed
-                    self.stats['whitespace_chars_removed'] += whitespace_removed
-                    self.stats['bytes_saved'] += bytes_saved
-                    
-                    print(f"Optimized: {rel_path} (saved {bytes_saved} bytes)")
-                else:
-                    # Copy non-processable files as-is
-                    os.makedirs(dst_path.parent, exist_ok=True)
-                    shutil.copy2(src_path, dst_path)
+        if not jobs:
+            return self.stats
+        
+        # Files are independent of each other, so optimize them in parallel
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _optimize_job,
+                [(self, src_path, dst_path) for src_path, dst_path, _ in jobs],
+                chunksize=32
+            )
+            for (_, _, rel_path), result in zip(jobs, results):
+                if result is None:
                     print(f"Copied: {rel_path}")
+                    continue
+                blank_removed, whitespace_removed, bytes_saved = result
+                self.stats['files_processed'] += 1
+                self.stats['blank_lines_removed'] += blank_removed
+                self.stats['whitespace_chars_removed'] += whitespace_removed
+                self.stats['bytes_saved'] += bytes_saved
+                
+                print(f"Optimized: {rel_path} (saved {bytes_saved} bytes)")
         
         return self.stats
 